@@ -111,6 +111,10 @@ else
     max_flag=4096
 fi
 
+if [ -z "$ncores" ]; then
+    ncores=1
+fi
+
 csp_in_vpath=$vcf
 csp_in_vname=`basename $vcf`
 
@@ -158,10 +162,27 @@ xcsp_vpath=$xcsp_dir/cellSNP.base.vcf.gz
 aim="merge pileup vcf and phase GT vcf"
 gt_vname=${csp_in_vname/.vcf/.gt.vcf}
 gt_vpath=$out_dir/$gt_vname
-cmd="zcat $csp_in_vpath | sed 's/^chr//' | $bin_bgzip -c > ${csp_in_vpath}.tmp &&
-     zcat $xcsp_vpath | sed 's/^chr//' | $bin_bgzip -c > ${xcsp_vpath}.tmp &&
-     $bin_bcftools view -Oz -T ${xcsp_vpath}.tmp ${csp_in_vpath}.tmp > $gt_vpath &&
-     rm ${csp_in_vpath}.tmp && rm ${xcsp_vpath}.tmp"
+# the two vcfs are independent, strip their leading chr concurrently when
+# more than one core is available. Always wait on both jobs, and use pipefail
+# so that a failure of zcat or sed is not hidden by bgzip. On failure, the
+# partial tmp files are removed and eval_cmd stops the pipeline.
+strip_in="(set -o pipefail; zcat $csp_in_vpath | sed 's/^chr//' | $bin_bgzip -c > ${csp_in_vpath}.tmp)"
+strip_xc="(set -o pipefail; zcat $xcsp_vpath | sed 's/^chr//' | $bin_bgzip -c > ${xcsp_vpath}.tmp)"
+if [ $ncores -gt 1 ]; then
+    cmd="$strip_in &
+         pid_in=\$!;
+         $strip_xc &
+         pid_xc=\$!;
+         wait \$pid_in; s_in=\$?;
+         wait \$pid_xc; s_xc=\$?;
+         [ \$s_in -eq 0 ] && [ \$s_xc -eq 0 ] &&"
+else
+    cmd="$strip_in && $strip_xc &&"
+fi
+cmd="$cmd
+     $bin_bcftools view -Oz --threads $ncores -T ${xcsp_vpath}.tmp ${csp_in_vpath}.tmp > $gt_vpath &&
+     rm ${csp_in_vpath}.tmp && rm ${xcsp_vpath}.tmp ||
+     { rm -f ${csp_in_vpath}.tmp ${xcsp_vpath}.tmp $gt_vpath; false; }"
 eval_cmd "$cmd" "$aim"
 
 #aim="extract phased GT"
@@ -32,7 +32,7 @@ bin_pileup=$work_dir/baf_pileup.sh
 
 ###### Init running ######
 # import utils
-source $utils        # import eval_cmd, load_cfg, log_msg, log_err
+source $utils        # import eval_cmd, print_cmd_log, load_cfg, log_msg, log_err
 
 function usage() {
     echo
@@ -131,6 +131,10 @@ else
     umi_opt="-u $umi"
 fi
 
+if [ -z "$ncores" ]; then
+    ncores=1
+fi
+
 sid=${smp_name}
 
 ###### Core Part ######
@@ -148,27 +152,65 @@ eval_cmd "$cmd" "$aim"
 
 xcsp_dir=$out_dir/xcltk-pileup
 gt_vpath=`ls $out_dir/*.gt.vcf.gz`
+if [ -z "$gt_vpath" ]; then
+    log_err "Error: phased GT vcf not found in $out_dir"
+    exit 1
+fi
 
-aim="phase SNPs into haplotype blocks of even size"
+aim_even="phase SNPs into haplotype blocks of even size"
 phs_even_dir=$out_dir/phase-snp-even
 mkdir -p $phs_even_dir &> /dev/null
 size=50    # kb
-cmd="$bin_xcltk convert -B $size -H $hg -o $phs_even_dir/blocks.${size}kb.tsv && \\
+cmd_even="$bin_xcltk convert -B $size -H $hg -o $phs_even_dir/blocks.${size}kb.tsv && \\
      $bin_xcltk phase_snp --sid ${sid}.${size}kb --snpAD $xcsp_dir/cellSNP.tag.AD.mtx \\
        --snpDP $xcsp_dir/cellSNP.tag.DP.mtx --phase $gt_vpath \\
        --region $phs_even_dir/blocks.${size}kb.tsv --outdir $phs_even_dir"
-eval_cmd "$cmd" "$aim"
-
-cp $out_dir/cellsnp-lite/cellSNP.samples.tsv $phs_even_dir
 
-aim="phase SNPs into haplotype blocks of features"
+aim_fet="phase SNPs into haplotype blocks of features"
 phs_fet_dir=$out_dir/phase-snp-feature
 mkdir -p $phs_fet_dir &> /dev/null
-cmd="$bin_xcltk phase_snp --sid ${sid}.feature --snpAD $xcsp_dir/cellSNP.tag.AD.mtx \\
+cmd_fet="$bin_xcltk phase_snp --sid ${sid}.feature --snpAD $xcsp_dir/cellSNP.tag.AD.mtx \\
        --snpDP $xcsp_dir/cellSNP.tag.DP.mtx \\
        --phase $gt_vpath --region $blocks --outdir $phs_fet_dir"
-eval_cmd "$cmd" "$aim"
 
+if [ $ncores -gt 1 ]; then
+    # both phasing runs only read the pileup outputs, so run them concurrently.
+    # Each job writes to its own temp log, which is printed after both finish.
+    log_even=$phs_even_dir/phase_snp.log.tmp
+    log_fet=$phs_fet_dir/phase_snp.log.tmp
+    (eval "$cmd_even") &> $log_even &
+    pid_even=$!
+    (eval "$cmd_fet") &> $log_fet &
+    pid_fet=$!
+
+    # stop the other job as soon as either one fails
+    ret=0
+    for i in 1 2; do
+        wait -n
+        ret=$?
+        if [ $ret -ne 0 ]; then
+            for pid in $pid_even $pid_fet; do
+                pkill -TERM -P $pid &> /dev/null
+                kill $pid &> /dev/null
+            done
+            wait
+            break
+        fi
+    done
+
+    print_cmd_log "$cmd_even" "$aim_even" $log_even
+    print_cmd_log "$cmd_fet" "$aim_fet" $log_fet
+    rm $log_even $log_fet
+    if [ $ret -ne 0 ]; then
+        log_err "Error: failed to phase SNPs into haplotype blocks"
+        exit 1
+    fi
+else
+    eval_cmd "$cmd_even" "$aim_even"
+    eval_cmd "$cmd_fet" "$aim_fet"
+fi
+
+cp $out_dir/cellsnp-lite/cellSNP.samples.tsv $phs_even_dir
 cp $out_dir/cellsnp-lite/cellSNP.samples.tsv $phs_fet_dir
 cp $blocks $phs_fet_dir
 
@@ -157,23 +157,18 @@ aim="bcftools fixref checking"
 cmd="$bin_bcftools +fixref $chr_vpath -- -f $fasta"
 eval_cmd "$cmd" "$aim"
 
-aim="xcltk fixref"
-fix_vname=${chr_vname/.vcf/.fixref.vcf}
-fix_vpath=$out_dir/$fix_vname
-tmp_prefix=${chr_vpath%.vcf.gz}
-cmd="$bin_xcltk fixref -i $chr_vpath -r $fasta -v | 
-     $bin_bgzip -c > $fix_vpath"
+# stream the fixref-ed vcf directly into dedup and sort, without writing
+# an intermediate fixref vcf to disk.
+aim="xcltk fixref, filter duplicates (chrom + pos) and sort"
+uniq_vname=${chr_vname/.vcf/.fixref.uniq.sort.vcf}
+uniq_vpath=$out_dir/$uniq_vname
+cmd="$bin_xcltk fixref -i $chr_vpath -r $fasta -v |
+     awk '\$0 ~ /^#/ {print; next;} ! a[\$1\":\"\$2] {print; a[\$1\":\"\$2]=1}' |
+     $bin_bcftools sort -Oz > $uniq_vpath"
 eval_cmd "$cmd" "$aim"
 
 aim="bcftools fixref checking"
-cmd="$bin_bcftools +fixref $fix_vpath -- -f $fasta"
-eval_cmd "$cmd" "$aim"
-
-aim="filter duplicates (chrom + pos) and sort"
-uniq_vname=${fix_vname/.vcf/.uniq.sort.vcf}
-uniq_vpath=$out_dir/$uniq_vname
-cmd="zcat $fix_vpath | awk '\$0 ~ /^#/ {print; next;} ! a[\$1\":\"\$2] {print; a[\$1\":\"\$2]=1}' | 
-     $bin_bcftools sort -Oz > $uniq_vpath"
+cmd="$bin_bcftools +fixref $uniq_vpath -- -f $fasta"
 eval_cmd "$cmd" "$aim"
 
 ###### END ######
@@ -47,6 +47,10 @@ function usage() {
     echo "                      freebayes [cellsnp-lite]"
     echo "  -d, --duplicates    If use, duplicate reads will be used"
     echo "  -u, --umi STR       If use, count UMIs instead of reads"
+    echo "  --minMAF FLOAT      Minimum minor allele frequency for SNP calling [0.1]"
+    echo "  --minCOUNT INT      Minimum aggregated count for SNP calling [20]"
+    echo "  --chroms STR        Comma separated target chroms, with or without"
+    echo "                      the leading 'chr' [1-22,X,Y]"
     echo "  -O, --outdir DIR    Path to output dir"
     echo "  -p, --ncores INT    Number of cores"
     echo "  -c, --config FILE   Path to config file. If not set, use the"
@@ -66,6 +70,8 @@ log_msg "Command Line: $cmdline"
 
 # default settings
 use_dup=0
+min_maf=0.1
+min_count=20
 
 # parse args
 log_msg "Parse cmdline ..."
@@ -74,7 +80,7 @@ if [ $# -lt 1 ]; then
     exit 1
 fi
 
-ARGS=`getopt -o N:s:L:f:g:C:du:O:p:c:h --long name:,bam:,bamList:,fasta:,hg:,call:,duplicates,umi:,outdir:,ncores:,config:,help -n "" -- "$@"`
+ARGS=`getopt -o N:s:L:f:g:C:du:O:p:c:h --long name:,bam:,bamList:,fasta:,hg:,call:,duplicates,umi:,minMAF:,minCOUNT:,chroms:,outdir:,ncores:,config:,help -n "" -- "$@"`
 if [ $? -ne 0 ]; then
     log_err "Error: failed to parse command line. Terminating..."
     exit 1
@@ -91,6 +97,9 @@ while true; do
         -C|--call) app_call=$2; shift 2;;
         -d|--duplicates) use_dup=1; shift;;
         -u|--umi) umi=$2; shift 2;;
+        --minMAF) min_maf=$2; shift 2;;
+        --minCOUNT) min_count=$2; shift 2;;
+        --chroms) chroms=$2; shift 2;;
         -O|--outdir) out_dir=$2; shift 2;;
         -p|--ncores) ncores=$2; shift 2;;
         -c|--config) cfg=$2; shift 2;;
@@ -158,14 +167,18 @@ fi
 aim="call germline SNPs"
 raw_vname=${sid}.hg${hg}.raw.vcf.gz
 raw_vpath=$out_dir/$raw_vname
-target_chroms="`seq 1 22` X Y"
-tgt_chroms=`echo $target_chroms | tr ' ' ',' | sed 's/,$//'`
+if [ -n "$chroms" ]; then    # chrom names without the leading 'chr', as in QC
+    tgt_chroms=`echo $chroms | tr -d ' ' | sed 's/^chr//; s/,chr/,/g; s/,$//'`
+else
+    target_chroms="`seq 1 22` X Y"
+    tgt_chroms=`echo $target_chroms | tr ' ' ',' | sed 's/,$//'`
+fi
 if [ "$app_call" == "freebayes" ]; then
-    cmd="$bin_freebayes -C 2 -F 0.1 -m 20 --min-coverage 20 -f $fasta $dup_opt $bam | 
-         $bin_bgzip -c > $raw_vpath"
+    cmd="$bin_freebayes -C 2 -F $min_maf -m 20 --min-coverage $min_count -f $fasta $dup_opt $bam | 
+         $bin_bgzip -@ $ncores -c > $raw_vpath"
 else
-    cmd="$bin_cellsnp $bam_opt -O $out_dir/cellsnp_pre -p $ncores --minMAF 0.1 \\
-         --minCOUNT 20 --minLEN 30 --minMAPQ 20 --exclFLAG $excl_flag --cellTAG None \\
+    cmd="$bin_cellsnp $bam_opt -O $out_dir/cellsnp_pre -p $ncores --minMAF $min_maf \\
+         --minCOUNT $min_count --minLEN 30 --minMAPQ 20 --exclFLAG $excl_flag --cellTAG None \\
          --UMItag $umi --chrom $tgt_chroms --gzip --genotype"
     raw_vpath=$out_dir/cellsnp_pre/cellSNP.cells.vcf.gz
 fi
@@ -178,42 +191,36 @@ aim="QC:
   + filter records that are not of SNP type;                         
   + filter strlen(REF) != 1 || N_ALT != 1;
   + rename chroms, remove the leading 'chr' from the name of chroms; 
-  + filter records not in target chroms (default chr1-22, X, Y);"
-qc_vname=${raw_vname/.vcf/.qc.vcf}
+  + filter records not in target chroms ($tgt_chroms);"
+# the QC-ed file is only read by bcftools in the next step, keep it as BCF to
+# skip VCF text formatting and parsing.
+qc_vname=${raw_vname%.vcf.gz}.qc.bcf
 qc_vpath=$out_dir/$qc_vname
 if [ "$app_call" == "freebayes" ]; then
-    cmd="$bin_bcftools view -Ou $raw_vpath | 
-      $bin_bcftools view -Ou -i 'QUAL > 20 && INFO/DP > 0' | 
-      $bin_bcftools view -Ou -i 'TYPE = \"snp\"' | 
-      $bin_bcftools view -Ou -i 'STRLEN(REF) == 1 && N_ALT == 1' | 
+    cmd="$bin_bcftools view -Ou -i 'QUAL > 20 && INFO/DP > 0 && TYPE = \"snp\" && STRLEN(REF) == 1 && N_ALT == 1' $raw_vpath | 
       $bin_bcftools annotate -Ou --rename-chrs $ucsc2ensembl | 
-      $bin_bcftools view -Oz -t $tgt_chroms > $qc_vpath"
+      $bin_bcftools view -Ob --threads $ncores -t $tgt_chroms > $qc_vpath"
 else
-    cmd="$bin_bcftools view -Ou $raw_vpath | 
-      $bin_bcftools view -Ou -i 'TYPE = \"snp\"' | 
+    cmd="$bin_bcftools view -Ou -i 'TYPE = \"snp\"' $raw_vpath | 
       $bin_bcftools annotate -Ou --rename-chrs $ucsc2ensembl | 
-      $bin_bcftools view -Oz -t $tgt_chroms > $qc_vpath"
+      $bin_bcftools view -Ob --threads $ncores -t $tgt_chroms > $qc_vpath"
 fi
 eval_cmd "$cmd" "$aim"
 
 aim="filter by GQ"
-gq_bed=$out_dir/${qc_vname%.vcf.gz}.gq.bed
-gq_vname=${qc_vname/.vcf/.gq.vcf}
+gq_bed=$out_dir/${qc_vname%.bcf}.gq.bed
+gq_vname=${raw_vname/.vcf/.qc.gq.vcf}
 gq_vpath=$out_dir/$gq_vname
 if [ "$app_call" == "freebayes" ]; then
-    cmd="$bin_bcftools view -Ou $qc_vpath | 
-      $bin_bcftools query -f '%CHROM\t%POS[\t%GL]\n' | 
+    cmd="$bin_bcftools query -f '%CHROM\t%POS[\t%GL]\n' $qc_vpath | 
       $bin_gl2gq | 
       awk '\$NF > 20 { printf(\"%s\t%d\t%d\t%s\n\", \$1, \$2 - 1, \$2, \$NF) }' > $gq_bed && 
-      $bin_bcftools view -Ou $qc_vpath | 
-      $bin_bcftools view -Oz -T $gq_bed > $gq_vpath"
+      $bin_bcftools view -Oz --threads $ncores -T $gq_bed $qc_vpath > $gq_vpath"
 else
-    cmd="$bin_bcftools view -Ou $qc_vpath | 
-      $bin_bcftools query -f '%CHROM\t%POS[\t%PL]\n' | 
+    cmd="$bin_bcftools query -f '%CHROM\t%POS[\t%PL]\n' $qc_vpath | 
       $bin_pl2gq | 
       awk '\$NF > 20 { printf(\"%s\t%d\t%d\t%s\n\", \$1, \$2 - 1, \$2, \$NF) }' > $gq_bed && 
-      $bin_bcftools view -Ou $qc_vpath | 
-      $bin_bcftools view -Oz -T $gq_bed > $gq_vpath"
+      $bin_bcftools view -Oz --threads $ncores -T $gq_bed $qc_vpath > $gq_vpath"
 fi
 eval_cmd "$cmd" "$aim"
 
@@ -231,7 +238,7 @@ if [ $hg -eq 19 ]; then
 else
     cmd="$bin_python $bin_py_liftover -c $chain_hg38to19 -i $flt_vpath \\
       -o ${lift_vpath/.vcf/.tmp.vcf} -P $bin_liftover && 
-      $bin_bcftools view -i 'POS > 0' -Oz ${lift_vpath/.vcf/.tmp.vcf} > ${lift_vpath} && 
+      $bin_bcftools view -i 'POS > 0' -Oz --threads $ncores ${lift_vpath/.vcf/.tmp.vcf} > ${lift_vpath} && 
       rm ${lift_vpath/.vcf/.tmp.vcf}"
     eval_cmd "$cmd" "$aim"
 fi
@@ -28,14 +28,40 @@ function eval_cmd() {
     echo "$cmd"
     echo "=> OUTPUT"
     eval "$cmd"
+    local ret=$?
     echo "=> DONE"
-    if [ $? -ne 0 ]; then
+    if [ $ret -ne 0 ]; then
         __exit "[E::eval_cmd] failed to run PART $aim"
     fi
     log_msg "END $aim"
     echo
 }
 
+#@abstract  Print the log of a command run in background, in the same
+#           layout as eval_cmd
+#@param $1  Command [str]
+#@param $2  Aim of this command [str]
+#@param $3  Log file of this command [str]
+#@return    No RetCode
+#@example   print_cmd_log "echo hello world" "test this function" hello.log
+function print_cmd_log() {
+    if [ $# -lt 3 ]; then
+        __exit "[E::print_cmd_log] too few arguments."
+    fi
+    local cmd="$1"
+    local aim="$2"
+    local log="$3"
+
+    log_msg "START $aim"
+    echo "=> COMMAND"
+    echo "$cmd"
+    echo "=> OUTPUT"
+    cat $log
+    echo "=> DONE"
+    log_msg "END $aim"
+    echo
+}
+
 function load_cfg() {
     if [ $# -lt 1 ]; then
         __exit "[E::load_cfg] too few arguments."
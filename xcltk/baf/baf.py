@@ -6,13 +6,14 @@ from .phase_snp import phase_snp
 from .config import APP
 
 def __usage(fp = sys.stderr):
-    msg =  "\n"
-    msg += "Usage: %s <command> [options]\n" % APP
-    msg += "\n"                                          \
-           "Commands:\n"                                  \
-           "  phase_snp      Aggregate SNPs into haplotype blocks.\n"     \
-           "  -h, --help     Print this message.\n"                      \
-           "\n"
+    msg = """
+Usage: %s <command> [options]
+
+Commands:
+  phase_snp      Aggregate SNPs into haplotype blocks.
+  -h, --help     Print this message.
+
+""" % APP
     fp.write(msg)
 
 def main():
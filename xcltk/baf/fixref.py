@@ -204,20 +204,21 @@ def __fix_file(in_fn, out_fn, ref_fn, verbose = False):
     return(0)
 
 def __usage(fp = sys.stderr):
-    msg =  "\n"
-    msg += "Usage: %s %s [options]\n" % (APP, COMMAND)
-    msg += "\n"                                                        \
-           "Options:\n"                                                \
-           "  -i, --input FILE    Path to input vcf file\n"              \
-           "  -r, --ref FILE      Path to reference genome fasta file\n"     \
-           "  -o, --output FILE   Path to output vcf file. if not set, output to stdout\n"    \
-           "  -v, --verbose       If use, output more detailed log info\n"                   \
-           "  -h, --help          Print this message\n"                                       \
-           "\n"                                            \
-           "Note:\n"                                       \
-           "  REF, ALT and GT would be checked and possibly fixed. Fields other than GT\n" \
-           "  in FORMAT would be deleted.\n"                     \
-           "\n"    
+    msg = """
+Usage: %s %s [options]
+
+Options:
+  -i, --input FILE    Path to input vcf file
+  -r, --ref FILE      Path to reference genome fasta file
+  -o, --output FILE   Path to output vcf file. if not set, output to stdout
+  -v, --verbose       If use, output more detailed log info
+  -h, --help          Print this message
+
+Note:
+  REF, ALT and GT would be checked and possibly fixed. Fields other than GT
+  in FORMAT would be deleted.
+
+""" % (APP, COMMAND)
     fp.write(msg)
 
 def fixref(argv):
@@ -227,19 +228,22 @@ def fixref(argv):
         sys.exit(1)
            
     opts, args = getopt.getopt(argv[2:], "-h-i:-r:-o:-v", ["help", "input=", "ref=", "output=", "verbose"])
-    ref_file = in_vcf_file = out_vcf_file = None
-    verbose = False
+    # option -> parameter of __fix_file()
+    opt_params = {
+        "-i": "in_fn", "--input": "in_fn",
+        "-r": "ref_fn", "--ref": "ref_fn",
+        "-o": "out_fn", "--output": "out_fn"
+    }
+    params = {"in_fn": None, "out_fn": None, "ref_fn": None, "verbose": False}
     for op, val in opts:
-        if op in ("-i", "--input"): in_vcf_file = val
-        elif op in ("-r", "--ref"): ref_file = val
-        elif op in ("-o", "--output"): out_vcf_file = val
-        elif op in ("-v", "--verbose"): verbose = True
+        if op in opt_params: params[opt_params[op]] = val
+        elif op in ("-v", "--verbose"): params["verbose"] = True
         elif op in ("-h", "--help"): __usage(sys.stderr); sys.exit(1)
         else: sys.stderr.write("invalid option: %s\n" % op); sys.exit(1)
 
     # TODO: check args
     
-    __fix_file(in_vcf_file, out_vcf_file, ref_file, verbose)
+    __fix_file(**params)
 
 if __name__ == "__main__":
     fixref(sys.argv)
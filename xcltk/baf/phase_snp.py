@@ -280,23 +280,22 @@ def __phase_snp2block(sid, snp_ad_file, snp_dp_file, phase_file, region_file, ou
     assert_e(snp_ad_file, "SNP DP mtx")
     assert_e(region_file, "Region file")
     assert_n(out_dir, "Output dir")
-    if not os.path.isdir(out_dir):
-        os.mkdir(out_dir)
+    os.makedirs(out_dir, exist_ok = True)
 
     # load SNP AD & DP mtx
     log("loading SNP AD mtx ...")
     res_ad = __load_snp_mtx(snp_ad_file)
     assert res_ad, "failed to load SNP AD mtx."
     nsnp_ad, ncell_ad, nrec_ad, snp_ad = res_ad[:4]
-    log("AD mtx header: nsnp = %d, ncell = %d, nrec = %d" % (nsnp_ad, ncell_ad, nrec_ad))
-    log("AD mtx: #uniq SNPs = %d" % len(snp_ad))
+    log("AD mtx header: nsnp = %d, ncell = %d, nrec = %d", nsnp_ad, ncell_ad, nrec_ad)
+    log("AD mtx: #uniq SNPs = %d", len(snp_ad))
 
     log("loading SNP DP mtx ...")
     res_dp = __load_snp_mtx(snp_dp_file)
     assert res_dp, "failed to load SNP DP mtx."
     nsnp_dp, ncell_dp, nrec_dp, snp_dp = res_dp[:4]
-    log("DP mtx header: nsnp = %d, ncell = %d, nrec = %d" % (nsnp_dp, ncell_dp, nrec_dp))
-    log("DP mtx: #uniq SNPs = %d" % len(snp_dp))
+    log("DP mtx header: nsnp = %d, ncell = %d, nrec = %d", nsnp_dp, ncell_dp, nrec_dp)
+    log("DP mtx: #uniq SNPs = %d", len(snp_dp))
 
     # check AD & DP mtx
     # all snp-cell combinations of AD should also exist in DP
@@ -320,7 +319,7 @@ def __phase_snp2block(sid, snp_ad_file, snp_dp_file, phase_file, region_file, ou
     res_phase = __load_phase(phase_file)
     assert res_phase, "failed to load phase file."
     nsnp_phase, nsnp_phase_valid, phase = res_phase[:3]
-    log("Phase file: total SNPs = %d, valid SNPs = %d" % (nsnp_phase, nsnp_phase_valid))
+    log("Phase file: total SNPs = %d, valid SNPs = %d", nsnp_phase, nsnp_phase_valid)
     assert nsnp_phase == nsnp_ad, "#snp of phase file not equal to the value in AD mtx header"
     assert nsnp_phase_valid >= len(snp_dp), "some snp_idx of DP not exist in phase file"
 
@@ -332,7 +331,7 @@ def __phase_snp2block(sid, snp_ad_file, snp_dp_file, phase_file, region_file, ou
             _ph[chrom] = [d for d in data if d[3] in snp_dp]
             n += len(_ph[chrom])
         phase = _ph
-        log("Phase file: total SNPs after removing those whose snp_idx not in DP = %d" % n)
+        log("Phase file: total SNPs after removing those whose snp_idx not in DP = %d", n)
 
     # sort snps by pos for phase file
     log("sort snps by pos for phase file ...")
@@ -371,20 +370,21 @@ def __phase_snp2block(sid, snp_ad_file, snp_dp_file, phase_file, region_file, ou
     log("All Done")
 
 def __usage(fp = sys.stderr):
-    msg =  "\n"
-    msg += "Usage: %s %s [options]\n" % (APP, COMMAND)
-    msg += "\n"                                                  \
-           "Options:\n"                                           \
-           "  --sid STR       Sample ID.\n"                        \
-           "  --snpAD FILE    Path to the SNP AD mtx, snp_idx and cell_idx are both 1-based.\n"   \
-           "  --snpDP FILE    Path to the SNP DP mtx, snp_idx and cell_idx are both 1-based.\n"   \
-           "  --phase FILE    Path to the SNP phase file, either VCF file or\n"                   \
-           "                  a tsv with 3 columns: <chr> <pos> <GT>; pos is 1-based.\n"         \
-           "  --region FILE   Path to region file: bed, gff or a tsv with 3 columns:\n"          \
-           "                  <chr> <start> <end>, both start and end are 1-based and included.\n"  \
-           "  --outdir DIR    Path to output dir.\n"                                             \
-           "  -h, --help      Print this message.\n"                                             \
-           "\n"
+    msg = """
+Usage: %s %s [options]
+
+Options:
+  --sid STR       Sample ID.
+  --snpAD FILE    Path to the SNP AD mtx, snp_idx and cell_idx are both 1-based.
+  --snpDP FILE    Path to the SNP DP mtx, snp_idx and cell_idx are both 1-based.
+  --phase FILE    Path to the SNP phase file, either VCF file or
+                  a tsv with 3 columns: <chr> <pos> <GT>; pos is 1-based.
+  --region FILE   Path to region file: bed, gff or a tsv with 3 columns:
+                  <chr> <start> <end>, both start and end are 1-based and included.
+  --outdir DIR    Path to output dir.
+  -h, --help      Print this message.
+
+""" % (APP, COMMAND)
     fp.write(msg)
 
 def phase_snp(argv):
@@ -394,18 +394,22 @@ def phase_snp(argv):
         sys.exit(1)
         
     opts, args = getopt.getopt(argv[2:], "-h", ["help", "sid=", "snpAD=", "snpDP=", "phase=", "region=", "outdir="])
-    sid = snp_ad_file = snp_dp_file = phase_file = region_file = out_dir = None
+    # option -> parameter of __phase_snp2block()
+    opt_params = {
+        "--sid": "sid",
+        "--snpAD": "snp_ad_file",
+        "--snpDP": "snp_dp_file",
+        "--phase": "phase_file",
+        "--region": "region_file",
+        "--outdir": "out_dir"
+    }
+    params = dict.fromkeys(opt_params.values())
     for op, val in opts:
-        if op in ("--sid", ): sid = val
-        elif op in ("--snpAD", ): snp_ad_file = val
-        elif op in ("--snpDP", ): snp_dp_file = val
-        elif op in ("--phase", ): phase_file = val
-        elif op in ("--region", ): region_file = val
-        elif op in ("--outdir", ): out_dir = val
+        if op in opt_params: params[opt_params[op]] = val
         elif op in ("-h", "--help"): __usage(sys.stderr); sys.exit(1)
         else: sys.stderr.write("invalid option: %s\n" % op); sys.exit(1)
 
-    __phase_snp2block(sid, snp_ad_file, snp_dp_file, phase_file, region_file, out_dir)
+    __phase_snp2block(**params)
 
 COMMAND = "phase_snp"
 
@@ -116,8 +116,29 @@ def pileup(argv):
         fid = open(options.sam_file_list, "r")
         sam_file_list = [x.rstrip() for x in fid.readlines()]
         fid.close()
+    # a sam file list may hold thousands of bam files from a few dirs, so list
+    # each of these dirs once instead of calling stat on every file.
+    dir_files = {}
+    if options.sam_file is None:
+        dir_cnt = {}
+        for sam_file in sam_file_list:
+            sam_dir = os.path.dirname(sam_file) or "."
+            dir_cnt[sam_dir] = dir_cnt.get(sam_dir, 0) + 1
+        for sam_dir in dir_cnt:
+            if dir_cnt[sam_dir] < 2:
+                continue
+            try:
+                dir_files[sam_dir] = {x.name for x in os.scandir(sam_dir)
+                                      if x.is_file()}
+            except OSError:     # e.g., dir can be entered but not listed
+                continue
     for sam_file in sam_file_list:
-        if os.path.isfile(sam_file) == False:
+        sam_dir = os.path.dirname(sam_file) or "."
+        if sam_dir in dir_files:
+            is_file = os.path.basename(sam_file) in dir_files[sam_dir]
+        else:
+            is_file = os.path.isfile(sam_file)
+        if not is_file:
             print("Error: No such file\n    -- %s" %sam_file)
             sys.exit(1)
         
@@ -148,8 +169,7 @@ def pileup(argv):
         barcodes = sorted(barcodes)
         
     if options.sparse_dir is not None:
-        if not os.path.exists(options.sparse_dir):
-            os.mkdir(options.sparse_dir)
+        os.makedirs(options.sparse_dir, exist_ok=True)
         out_file = options.sparse_dir + "/cellSNP.cells.vcf.gz"
     elif options.out_file is None:
         print("Error: need outFile for output file path and name.")
@@ -208,7 +228,11 @@ def pileup(argv):
     else:
         UMI_tag = options.UMI_tag
     
+    # never spawn more subprocesses than tasks: one per chrom in mode 2, and
+    # at least one SNP per subprocess otherwise.
     nproc = options.nproc
+    n_task = len(chrom_all) if region_file is None else len(pos_list)
+    nproc = max(1, min(nproc, n_task))
     min_MAF = options.min_MAF
     min_LEN = options.min_LEN
     min_MAPQ = options.min_MAPQ
@@ -220,12 +244,13 @@ def pileup(argv):
         max_FLAG = DEF_FLAG_WITHOUT_UMI if UMI_tag is None else DEF_FLAG_WITH_UMI
 
     result, out_files = [], []
+    tmp_file_fmt = out_file + ".temp_%s_"     # one temp file per chrom or subprocess
     if region_file is None:
         # pileup in each chrom
         if nproc > 1:
             pool = multiprocessing.Pool(processes=nproc)
             for _chrom in chrom_all:
-                chr_out_file = out_file + ".temp_%s_" %(_chrom)
+                chr_out_file = tmp_file_fmt %(_chrom)
                 out_files.append(chr_out_file)
                 result.append(pool.apply_async(pileup_regions, (sam_file_list[0], 
                     barcodes, chr_out_file, _chrom, cell_tag, UMI_tag, 
@@ -236,7 +261,7 @@ def pileup(argv):
             pool.join()
         else:
             for _chrom in chrom_all:
-                chr_out_file = out_file + ".temp_%s_" %(_chrom)
+                chr_out_file = tmp_file_fmt %(_chrom)
                 out_files.append(chr_out_file)
                 pileup_regions(sam_file_list[0], barcodes, chr_out_file, _chrom, 
                                cell_tag, UMI_tag, min_COUNT, min_MAF, min_MAPQ, 
@@ -248,7 +273,7 @@ def pileup(argv):
     else:
         # fetch each position
         if (nproc == 1):
-            out_file_tmp = out_file + ".temp_0_"
+            out_file_tmp = tmp_file_fmt %(0)
             out_files.append(out_file_tmp)
             result = fetch_positions(sam_file_list,                 
                 chrom_list, pos_list, REF_list, ALT_list, barcodes, sample_ids, 
@@ -259,7 +284,7 @@ def pileup(argv):
             LEN_div = int(len(chrom_list) / nproc)
             pool = multiprocessing.Pool(processes=nproc)
             for ii in range(nproc):
-                out_file_tmp = out_file + ".temp_%d_" %(ii)
+                out_file_tmp = tmp_file_fmt %(ii)
                 out_files.append(out_file_tmp)
 
                 if ii == nproc - 1:
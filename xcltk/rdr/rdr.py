@@ -5,12 +5,13 @@ import sys
 from .config import APP
 
 def __usage(fp = sys.stderr):
-    msg =  "\n"
-    msg += "Usage: %s <command> [options]\n" % APP
-    msg += "\n"                                          \
-           "Commands:\n"                                  \
-           "  -h, --help     Print this message.\n"       \
-           "\n"
+    msg = """
+Usage: %s <command> [options]
+
+Commands:
+  -h, --help     Print this message.
+
+""" % APP
     fp.write(msg)
 
 def main():
@@ -6,13 +6,14 @@ from .convert import convert
 from .config import APP
 
 def __usage(fp = sys.stderr):
-    msg =  "\n"
-    msg += "Usage: %s <command> [options]\n" % APP 
-    msg += "\n"                                          \
-           "Commands:\n"                                  \
-           "  convert        Convert different region file formats.\n"  \
-           "  -h, --help     Print this message.\n"                    \
-           "\n"
+    msg = """
+Usage: %s <command> [options]
+
+Commands:
+  convert        Convert different region file formats.
+  -h, --help     Print this message.
+
+""" % APP
     fp.write(msg)
 
 def main():
@@ -53,13 +53,17 @@ def get_now_str(fmt = "%Y-%m-%d %H:%M:%S"):
     """
     return time.strftime(fmt, time.localtime())
 
-def log(msg, fp = sys.stdout):
+def log(msg, *args, fp = sys.stdout):
     """
     @abstract   Format log message and print
-    @param msg  Log message to be printed [str]
+    @param msg  Log message to be printed, may contain %-style placeholders [str]
+    @param args Values for the placeholders in msg, if any
     @param fp   File pointer [FILE*]
     @return     Void
+    @example    log("%d SNPs loaded", nsnp)
     """
+    if args:
+        msg = msg % args
     fp.write("[%s] %s\n" % (get_now_str(), msg))
 
 ## The two function id_mapping() and unique_list() are copied from 
@@ -3,6 +3,7 @@
 # Author: Yuanhua Huang
 # Date: 09/06/2019
 
+import io
 import os
 import sys
 import gzip
@@ -160,16 +161,11 @@ def read_sparse_GeneINFO(GenoINFO, keys=['AD', 'DP']):
     return RV
 
 
-def merge_vcf(out_file, out_files, hdf5_out=True):
-    """Merge vcf for all chromsomes
+def __cat_vcf(out_files, fid_out):
+    """Write the temp vcf files to fid_out, keeping only the header of the
+    first file. Return the number of lines written.
     """
-    if out_file.endswith(".gz"):
-        out_file_use = out_file.split(".gz")[0]
-    else:
-        out_file_use = out_file
-        
     CNT = 0
-    fid_out = open(out_file_use, "w")
     for _file in out_files:
         with open(_file, "r") as fid_in:
             for line in fid_in:
@@ -178,21 +174,54 @@ def merge_vcf(out_file, out_files, hdf5_out=True):
                 else:
                     CNT += 1
                     fid_out.writelines(line)
-        os.remove(_file)
-    fid_out.close()
-    print("[cellSNP] %d lines in final vcf file" %CNT)
-    
+    return CNT
+
+
+def merge_vcf(out_file, out_files, hdf5_out=True):
+    """Merge vcf for all chromsomes
+
+    The temp files hold disjoint sets of variants, so they are simply
+    concatenated and streamed into bgzip (or gzip), without writing an
+    uncompressed intermediate file. The temp files are removed only after
+    the compressed file is completely written.
+    """
+    if out_file.endswith(".gz"):
+        out_file_use = out_file.split(".gz")[0]
+    else:
+        out_file_use = out_file
+    out_file_gz = out_file_use + ".gz"
+
     import shutil
     if shutil.which("bgzip") is not None:
-        bashCommand = "bgzip -f %s" %(out_file_use)
+        broken_pipe = False
+        with open(out_file_gz, "wb") as fp_gz:
+            pro = subprocess.Popen(["bgzip", "-c"], stdin=subprocess.PIPE,
+                                   stdout=fp_gz)
+            try:
+                with io.TextIOWrapper(pro.stdin) as fid_out:
+                    CNT = __cat_vcf(out_files, fid_out)
+            except BrokenPipeError:
+                broken_pipe = True
+            except BaseException:
+                pro.kill()
+                raise
+            finally:
+                ret = pro.wait()
+        if broken_pipe or ret != 0:
+            os.remove(out_file_gz)
+            raise IOError("bgzip failed (exit code %d) while writing '%s'; "
+                          "temp files are kept." % (ret, out_file_gz))
     else:
-        bashCommand = "gzip -f %s" %(out_file_use)
-    pro = subprocess.Popen(bashCommand.split(), stdout=subprocess.PIPE)
-    pro.communicate()[0]
+        with gzip.open(out_file_gz, "wt") as fid_out:
+            CNT = __cat_vcf(out_files, fid_out)
+
+    for _file in out_files:
+        os.remove(_file)
+    print("[cellSNP] %d lines in final vcf file" %CNT)
 
     ## save to hdf5 file
     if hdf5_out:
-        vcf_dat = load_VCF(out_file_use + ".gz", load_sample=True, sparse=True)
+        vcf_dat = load_VCF(out_file_gz, load_sample=True, sparse=True)
         write_VCF_to_hdf5(vcf_dat, out_file_use + ".h5")
     
     return None
@@ -255,13 +284,14 @@ def VCF_to_sparseMat(vcf_file, tags=["AD", "DP"], out_dir=None):
     infile.close()
 
     if out_dir is not None:
-        if not os.path.exists(out_dir):
-            os.mkdir(out_dir)
+        os.makedirs(out_dir, exist_ok=True)
+        base_vcf_file = out_dir + "/cellSNP.base.vcf"
+        tag_mtx_fmt = out_dir + "/cellSNP.tag.%s.mtx"
         fid_obs = open(out_dir + "/cellSNP.samples.tsv", "w")
         fid_obs.writelines("\n".join(samples) + "\n")
         fid_obs.close()
 
-        fid_var = open(out_dir + "/cellSNP.base.vcf", "w")
+        fid_var = open(base_vcf_file, "w")
         fid_var.writelines("##fileformat=VCFv4.2\n")
         fid_var.writelines("#CHROM\tPOS\tID\tREF\tALT\tQUAL\tFILTER\tINFO\n")
         for _var_info in var_info:
@@ -271,9 +301,9 @@ def VCF_to_sparseMat(vcf_file, tags=["AD", "DP"], out_dir=None):
         try:
             import shutil
             if shutil.which("bgzip") is not None:
-                bashCommand = "bgzip -f %s" %(out_dir + "/cellSNP.base.vcf")
+                bashCommand = "bgzip -f %s" %(base_vcf_file)
             else:
-                bashCommand = "gzip -f %s" %(out_dir + "/cellSNP.base.vcf")
+                bashCommand = "gzip -f %s" %(base_vcf_file)
             pro = subprocess.Popen(bashCommand.split(), stdout=subprocess.PIPE)
             pro.communicate()[0]
         except:
@@ -284,7 +314,7 @@ def VCF_to_sparseMat(vcf_file, tags=["AD", "DP"], out_dir=None):
             _dat = _mat["data"]
             _row = _mat["row"]
             _col = _mat["col"]
-            fid = open(out_dir + "/cellSNP.tag.%s.mtx" %(tags[ii]), "w")
+            fid = open(tag_mtx_fmt %(tags[ii]), "w")
             fid.writelines("%" + 
                            "%MatrixMarket matrix coordinate integer general\n")
             fid.writelines("%\n")
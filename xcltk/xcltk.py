@@ -6,36 +6,43 @@
 # - add install list (conda + pip)
 
 import sys
+from importlib import import_module
 from .config import PROGRAM, VERSION
-from .baf.fixref import fixref as baf_fix_ref
-from .baf.phase_snp import phase_snp as baf_phase_snp
-from .baf.pileup import pileup as baf_pileup
-from .rdr.basefc import base_fc as rdr_base_fc
-from .region.convert import convert as reg_convert
+
+# command -> (module, function). The module is imported only when its command
+# is run, so that e.g. --help and --version do not load numpy or pysam.
+COMMANDS = {
+    "fixref":    (".baf.fixref", "fixref"),
+    "phase_snp": (".baf.phase_snp", "phase_snp"),
+    "pileup":    (".baf.pileup", "pileup"),
+    "basefc":    (".rdr.basefc", "base_fc"),
+    "convert":   (".region.convert", "convert")
+}
 
 def __usage(fp = sys.stderr):
-    msg =  "\n"
-    msg += "Program: %s (Toolkit for XClone)\n" % PROGRAM
-    msg += "Version: %s\n" % VERSION
-    msg += "\n"
-    msg += "Usage:   %s <command> [options]\n" % PROGRAM
-    msg += "\n"                                          \
-           "Commands:\n"                                  \
-           "  -- BAF calculation\n"                                        \
-           "     fixref           Fix REF, ALT and GT\n"                    \
-           "     phase_snp        Aggregate SNPs into haplotype blocks\n"    \
-           "     pileup           Pileup, support unique counting\n"         \
-           "\n"                                                              \
-           "  -- RDR calculation\n"                                          \
-           "     basefc           Basic feature count\n"                     \
-           "\n"                                                              \
-           "  -- Region operations\n"                                        \
-           "     convert          Convert different region file formats\n"   \
-           "\n"                                                              \
-           "  -- Others\n"                                                   \
-           "     -h, --help       Print this message\n"                       \
-           "     -V, --version    Print version\n"                            \
-           "\n"
+    msg = """
+Program: %(prog)s (Toolkit for XClone)
+Version: %(ver)s
+
+Usage:   %(prog)s <command> [options]
+
+Commands:
+  -- BAF calculation
+     fixref           Fix REF, ALT and GT
+     phase_snp        Aggregate SNPs into haplotype blocks
+     pileup           Pileup, support unique counting
+
+  -- RDR calculation
+     basefc           Basic feature count
+
+  -- Region operations
+     convert          Convert different region file formats
+
+  -- Others
+     -h, --help       Print this message
+     -V, --version    Print version
+
+""" % {"prog": PROGRAM, "ver": VERSION}
     fp.write(msg)
 
 def main():
@@ -45,14 +52,14 @@ def main():
         sys.exit(1)
 
     command = sys.argv[1]
-    if command == "fixref": baf_fix_ref(sys.argv)
-    elif command == "phase_snp": baf_phase_snp(sys.argv)
-    elif command == "pileup": baf_pileup(sys.argv)
-    elif command == "basefc": rdr_base_fc(sys.argv)
-    elif command == "convert": reg_convert(sys.argv)
-    elif command in ("-h", "--help"): __usage(); sys.exit(3)
+    if command in ("-h", "--help"): __usage(); sys.exit(3)
     elif command in ("-V", "--version"): sys.stderr.write("%s\n" % VERSION); sys.exit(3)
-    else: sys.stderr.write("Error: wrong command '%s'\n" % command); sys.exit(5)
+    elif command not in COMMANDS:
+        sys.stderr.write("Error: wrong command '%s'\n" % command); sys.exit(5)
+
+    mod_name, func_name = COMMANDS[command]
+    func = getattr(import_module(mod_name, __package__), func_name)
+    func(sys.argv)
 
 if __name__ == "__main__":
     main()